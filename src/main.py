@@ -97,6 +97,10 @@ class C0lorNoteApp:
             if hasattr(self.main_window, 'save_all_notes'):
                 self.main_window.save_all_notes()
             
+            # Let pending exports finish writing
+            if hasattr(self.main_window, 'shutdown'):
+                self.main_window.shutdown()
+            
             # Close database connection
             close_db()
             
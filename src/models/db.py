@@ -12,7 +12,7 @@ import datetime
 from pathlib import Path
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine, event, inspect
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.pool import StaticPool
@@ -27,6 +27,31 @@ Base = declarative_base()
 engine = None
 Session = None
 session_factory = None
+fts_available = False
+
+# External-content FTS5 index over note titles and plain text. notes.id is a
+# UUID string, so the index is keyed by the table's implicit rowid instead.
+FTS_SCHEMA = [
+    """CREATE VIRTUAL TABLE notes_fts USING fts5(
+        title, plain_content, content='notes', content_rowid='rowid'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS notes_fts_ai AFTER INSERT ON notes BEGIN
+        INSERT INTO notes_fts(rowid, title, plain_content)
+        VALUES (new.rowid, new.title, new.plain_content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS notes_fts_ad AFTER DELETE ON notes BEGIN
+        INSERT INTO notes_fts(notes_fts, rowid, title, plain_content)
+        VALUES ('delete', old.rowid, old.title, old.plain_content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS notes_fts_au AFTER UPDATE ON notes BEGIN
+        INSERT INTO notes_fts(notes_fts, rowid, title, plain_content)
+        VALUES ('delete', old.rowid, old.title, old.plain_content);
+        INSERT INTO notes_fts(rowid, title, plain_content)
+        VALUES (new.rowid, new.title, new.plain_content);
+    END""",
+    # Index notes that existed before the FTS table was created
+    "INSERT INTO notes_fts(notes_fts) VALUES ('rebuild')",
+]
 
 
 def get_db_path():
@@ -81,6 +106,7 @@ def initialize_db():
         
         # Create tables if they don't exist
         Base.metadata.create_all(engine)
+        setup_fulltext_search()
         
         # Check if we need to run migrations
         current_version = get_db_version()
@@ -109,6 +135,33 @@ def close_db():
         return False
 
 
+def setup_fulltext_search():
+    """
+    Create the notes_fts full-text index and its sync triggers if missing
+    
+    Returns:
+        bool: True if full-text search is available, False otherwise
+    """
+    global fts_available
+    
+    try:
+        with engine.begin() as connection:
+            exists = connection.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'notes_fts'"
+            )).first()
+            if not exists:
+                for statement in FTS_SCHEMA:
+                    connection.execute(text(statement))
+                logging.info("Created full-text search index")
+        fts_available = True
+    except Exception as e:
+        # SQLite builds without FTS5 fall back to in-memory search
+        logging.warning(f"Full-text search unavailable: {e}")
+        fts_available = False
+    
+    return fts_available
+
+
 @contextmanager
 def db_session():
     """
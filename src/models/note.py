@@ -9,11 +9,12 @@ import datetime
 from typing import List, Optional, Dict, Any, Union
 from sqlalchemy import (
     Column, String, Text, DateTime, Boolean, 
-    ForeignKey, Table, func, or_, and_, desc
+    ForeignKey, Table, func, or_, and_, desc, text
 )
 from sqlalchemy.orm import relationship, joinedload
 from sqlalchemy.sql import expression
 
+from src.models import db
 from src.models.db import Base, db_session, Session
 
 
@@ -356,6 +357,34 @@ class Note(Base):
             # Order by pinned status and last modified date
             return query.order_by(cls.is_pinned.desc(), cls.modified_date.desc()).all()
     
+    @classmethod
+    def match_prefix_ids(cls, prefix: str) -> Optional[List[str]]:
+        """
+        Find notes with a word in the title or content starting with a prefix
+        
+        Uses the notes_fts full-text index, so only whole-word prefixes match.
+        
+        Args:
+            prefix (str): Prefix to match against the start of words
+            
+        Returns:
+            Optional[List[str]]: IDs of matching notes, or None if full-text
+                search is unavailable
+        """
+        if not db.fts_available:
+            return None
+        
+        # Quote the prefix as an FTS phrase so operators in it are literal
+        match_query = '"' + prefix.replace('"', '""') + '"*'
+        with db_session() as session:
+            rows = session.execute(
+                text("SELECT notes.id FROM notes_fts "
+                     "JOIN notes ON notes.rowid = notes_fts.rowid "
+                     "WHERE notes_fts MATCH :query"),
+                {"query": match_query}
+            )
+            return [row[0] for row in rows]
+    
     @classmethod
     def get_by_category(cls, category_id: str, include_tags: bool = True) -> List['Note']:
         """
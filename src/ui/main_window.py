@@ -6,20 +6,74 @@ including the sidebar, toolbar, note listing, and note editing areas.
 """
 
 import os
+import re
 import logging
 import datetime
-import datetime
+import bisect
+import concurrent.futures
+from collections import defaultdict
+from contextlib import contextmanager
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog, simpledialog
+from tkinter import ttk, messagebox
 from tkinter import font as tkfont
-import re
-from typing import Dict, List, Optional, Callable, Any, Tuple
-import threading
+from typing import Dict, List, Optional, Set, Tuple
 
 from src.config import settings
 from src.models.note import Note, Tag, Category
 from src.ui.theme_manager import ThemeManager
 
+# Shared helpers for note list previews
+_WS_RE = re.compile(r"\s+")
+_UNTITLED = "Untitled"
+PREVIEW_LENGTH = 100
+DATE_DISPLAY_FORMAT = "%b %d, %Y %H:%M"
+
+# Delay before a search is applied, so a burst of keystrokes filters once
+SEARCH_DEBOUNCE_MS = 150
+
+# Shortest query ranked through the full-text index; shorter prefixes match
+# nearly every note, so the query would cost a lot and reorder little
+FTS_RANK_MIN_LENGTH = 3
+
+# How often the UI thread checks whether a background file write has finished
+IO_POLL_MS = 50
+
+# Notes list geometry: fixed row pitch, and rows rendered beyond each edge of the view
+NOTE_ITEM_HEIGHT = 84
+NOTE_LIST_OVERSCAN = 4
+
+# How far back the "Recent Notes" view reaches
+RECENT_VIEW_AGE = datetime.timedelta(days=7)
+
+
+def _format_preview(text: Optional[str]) -> str:
+    """
+    Collapse whitespace in note content and truncate it for the notes list
+    
+    Args:
+        text (str): Plain note content
+        
+    Returns:
+        str: Single-line preview text
+    """
+    preview = _WS_RE.sub(" ", text or "").strip()
+    if len(preview) > PREVIEW_LENGTH:
+        preview = preview[:PREVIEW_LENGTH] + "..."
+    return preview
+
+
+def _trigrams(text: str) -> Set[str]:
+    """
+    Get the set of three-character substrings of a string
+    
+    Args:
+        text (str): Text to split
+        
+    Returns:
+        Set[str]: All trigrams in the text
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
 
 class MainWindow:
     """Main window for the C0lorNote application"""
@@ -35,26 +89,51 @@ class MainWindow:
         self.root = root
         self.theme_manager = theme_manager
         self.colors = self.theme_manager.get_current_theme_colors()
+        self._note_color_map = dict(self.colors["note_colors"])
         
-        # Set application icon
-        try:
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 
-                                   "assets", "icon.png")
-            if os.path.exists(icon_path):
-                icon = tk.PhotoImage(file=icon_path)
-                self.root.iconphoto(True, icon)
-        except Exception as e:
-            logging.warning(f"Could not load application icon: {e}")
+        # Single worker so file writes never block the event loop and stay ordered
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         
         # State variables
         self.current_note = None
         self.notes = []
         self.categories = []
         self.tags = []
+        self._cat_buttons: Dict[str, ttk.Button] = {}  # category ID -> sidebar button
+        self._tag_buttons: Dict[str, ttk.Button] = {}  # tag ID -> sidebar button
+        self._cat_items: Dict[str, Category] = {}  # category ID -> current category, for button clicks
+        self._tag_items: Dict[str, Tag] = {}  # tag ID -> current tag, for button clicks
         self.autosave_timer = None
         self.search_active = False
+        self._search_job = None
+        self._last_search = ("", [])  # (query, matching notes) of the last filter pass
+        self._search_index: Dict[str, Tuple[bytes, bytes]] = {}  # note ID -> lowercased UTF-8 (title, content)
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)  # trigram -> IDs of notes containing it
+        self._note_trigrams: Dict[str, Set[str]] = {}  # note ID -> its trigrams, for unindexing
+        self._sorted_titles: List[Tuple[str, str]] = []  # (lowercased title, note ID), sorted
+        self._id_to_index: Dict[str, int] = {}  # note ID -> position in self.notes
+        self._by_modified_desc: List = []  # notes, most recently modified first
+        self._modified_keys: List[float] = []  # -modified timestamp of each, ascending, for bisect
+        self._pinned_notes: List = []  # pinned notes, in self.notes order
         self.is_editing = False
         self.selected_note_index = -1
+        self._dirty = False  # unsaved edits to the current note
+        
+        # Virtualized notes list: displayed rows of self.notes, plus a pool of
+        # reusable item canvases with their canvas window item and the row and
+        # y offset each one shows
+        self._display_rows: List[int] = []
+        self._row_pool: List[tk.Canvas] = []
+        self._slot_items: List[int] = []
+        self._slot_rows: List[Optional[int]] = []
+        self._slot_y: List[Optional[int]] = []
+        
+        # Display fields for the notes list, parallel to self.notes
+        self._titles: List[str] = []
+        self._previews: List[str] = []
+        self._dates_fmt: List[str] = []
+        self._colors_bg: List[str] = []
+        self._pins: List[bool] = []
         
         # Create main layout
         self.create_layout()
@@ -286,6 +365,7 @@ class MainWindow:
             highlightthickness=0,
             borderwidth=0
         )
+        self.theme_manager.register(self.notes_canvas, "bg")
         
         self.notes_scrollbar = ttk.Scrollbar(
             self.notes_list_canvas_frame, 
@@ -295,24 +375,31 @@ class MainWindow:
         self.notes_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         self.notes_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.notes_canvas.configure(yscrollcommand=self.notes_scrollbar.set)
-        
-        # Create the container for notes
-        self.notes_container = ttk.Frame(self.notes_canvas)
-        self.notes_canvas_window = self.notes_canvas.create_window(
-            (0, 0), 
-            window=self.notes_container, 
-            anchor='nw',
-            tags='notes_container'
-        )
+        self.notes_canvas.configure(yscrollcommand=self.on_notes_yscroll)
         
-        # Bind events for scrolling and resizing
-        self.notes_container.bind("<Configure>", self.on_notes_container_configure)
+        # Bind events for resizing
         self.notes_canvas.bind("<Configure>", self.on_notes_canvas_configure)
         
-        # Create frame for note items
-        self.note_items_frame = ttk.Frame(self.notes_container)
-        self.note_items_frame.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+        # Mouse wheel scrolling is bound once on the toplevel's bind tag, which
+        # every row already carries, instead of on each note item
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind(sequence, self.on_notes_mousewheel, add="+")
+        
+        # Note items are canvas window items at fixed offsets in the canvas. Only
+        # the scrollregion spans the whole list, so no X window is ever taller
+        # than the view (X11 window coordinates are 16-bit)
+        self.empty_label = ttk.Label(
+            self.notes_canvas,
+            text="No notes found",
+            font=self.theme_manager.text_font,
+            padding=20
+        )
+        self._empty_item = self.notes_canvas.create_window(
+            0, 20, 
+            window=self.empty_label, 
+            anchor=tk.N,
+            state=tk.HIDDEN
+        )
     
     def create_note_editor(self):
         """Create the note editor panel with formatting toolbar"""
@@ -326,6 +413,7 @@ class MainWindow:
         
         # Title field
         self.title_var = tk.StringVar()
+        self.title_var.trace_add("write", self._on_title_var_write)
         self.title_entry = ttk.Entry(
             self.toolbar_frame, 
             textvariable=self.title_var,
@@ -458,6 +546,7 @@ class MainWindow:
         
         self.text_editor.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.text_editor.configure(yscrollcommand=self.editor_scrollbar.set)
+        self.theme_manager.register(self.text_editor, "text")
         
         # Configure tags for formatting
         self.text_editor.tag_configure("bold", font=self.theme_manager.bold_font)
@@ -472,6 +561,7 @@ class MainWindow:
         
         # Bind events for text editor
         self.text_editor.bind("<KeyRelease>", self.on_text_changed)
+        self.text_editor.bind("<<Modified>>", self._on_text_modified)
         
         # Status bar
         self.status_bar = ttk.Frame(self.editor_frame)
@@ -519,18 +609,41 @@ class MainWindow:
                 settings["window_y"] = y
                 settings.save_settings(settings)
     
-    def on_notes_container_configure(self, event):
-        """Handle notes container resize"""
-        # Update the scrollregion when the size of the notes container changes
-        self.notes_canvas.configure(scrollregion=self.notes_canvas.bbox("all"))
-    
     def on_notes_canvas_configure(self, event):
         """Handle notes canvas resize"""
-        # Resize the notes container to fill the canvas width
-        self.notes_canvas.itemconfig(
-            self.notes_canvas_window, 
-            width=event.width
-        )
+        # Stretch the note items to the canvas width
+        for item in self._slot_items:
+            self.notes_canvas.itemconfigure(item, width=max(event.width - 10, 1))
+        self.notes_canvas.coords(self._empty_item, event.width // 2, 20)
+        
+        # A taller canvas may expose more rows
+        self._refresh_visible_rows()
+    
+    def on_notes_yscroll(self, first, last):
+        """
+        Handle the notes list view moving (scrollbar, wheel or resize)
+        
+        Args:
+            first: Top of the visible region as a fraction of the list
+            last: Bottom of the visible region as a fraction of the list
+        """
+        self.notes_scrollbar.set(first, last)
+        self._refresh_visible_rows()
+    
+    def on_notes_mousewheel(self, event):
+        """Scroll the notes list when the wheel is used over it"""
+        # Ignore wheel events over other parts of the window
+        if not str(event.widget).startswith(str(self.notes_canvas)):
+            return
+        
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        else:
+            units = int(-event.delta / 120) or (-1 if event.delta > 0 else 1)
+        
+        self.notes_canvas.yview_scroll(units, "units")
     
     def load_categories(self):
         """Load categories from database"""
@@ -544,123 +657,310 @@ class MainWindow:
     def load_notes(self):
         """Load all notes from database"""
         self.notes = Note.get_all()
+        
+        # Build the search indexes
+        self._search_index = {}
+        self._trigrams = defaultdict(set)
+        self._note_trigrams = {}
+        self._sorted_titles = []
+        for note in self.notes:
+            self._index_note(note)
+        
+        self._reindex()
+        self._rebuild_note_cache()
         self.render_notes()
     
+    def _reindex(self):
+        """Rebuild the note ID -> position map and smart view lists; call whenever self.notes changes"""
+        self._id_to_index = {note.id: i for i, note in enumerate(self.notes)}
+        
+        self._by_modified_desc = sorted(self.notes, key=lambda n: n.modified_date, reverse=True)
+        self._modified_keys = [-note.modified_date.timestamp() for note in self._by_modified_desc]
+        self._pinned_notes = [note for note in self.notes if note.is_pinned]
+    
+    def _move_to_most_recent(self, note, old_modified):
+        """
+        Move a just-saved note to the front of the recently modified list
+        
+        Args:
+            note: The note, whose modified_date is already updated
+            old_modified (datetime.datetime): The note's modified_date before the save
+        """
+        i = bisect.bisect_left(self._modified_keys, -old_modified.timestamp())
+        while i < len(self._by_modified_desc) and self._by_modified_desc[i] is not note:
+            i += 1
+        if i < len(self._by_modified_desc):
+            del self._by_modified_desc[i]
+            del self._modified_keys[i]
+        
+        self._by_modified_desc.insert(0, note)
+        self._modified_keys.insert(0, -note.modified_date.timestamp())
+    
+    def _index_note(self, note):
+        """
+        Add a note to the search indexes
+        
+        Args:
+            note: The note to index
+        """
+        lc_title = (note.title or "").lower()
+        lc_body = (note.plain_content or "").lower()
+        
+        # Matched as UTF-8 bytes: substring tests on bytes skip str's per-kind dispatch,
+        # and UTF-8 is self-synchronizing so byte and character matches agree
+        self._search_index[note.id] = (lc_title.encode("utf-8"), lc_body.encode("utf-8"))
+        bisect.insort(self._sorted_titles, (lc_title, note.id))
+        
+        # Title and content are split separately so no trigram spans both
+        note_trigrams = _trigrams(lc_title) | _trigrams(lc_body)
+        self._note_trigrams[note.id] = note_trigrams
+        for trigram in note_trigrams:
+            self._trigrams[trigram].add(note.id)
+    
+    def _unindex_note(self, note_id):
+        """
+        Remove a note from the search indexes
+        
+        Args:
+            note_id (str): ID of the note to remove
+        """
+        entry = self._search_index.pop(note_id, None)
+        if entry is not None:
+            key = (entry[0].decode("utf-8"), note_id)
+            i = bisect.bisect_left(self._sorted_titles, key)
+            if i < len(self._sorted_titles) and self._sorted_titles[i] == key:
+                del self._sorted_titles[i]
+        
+        for trigram in self._note_trigrams.pop(note_id, ()):
+            postings = self._trigrams[trigram]
+            postings.discard(note_id)
+            if not postings:
+                del self._trigrams[trigram]
+    
+    def _rebuild_note_cache(self):
+        """
+        Precompute the display fields of every note for the notes list
+        
+        The fields are kept as parallel lists indexed like self.notes, so the
+        render loop does indexed list access instead of attribute lookups,
+        string formatting and color resolution per row.
+        """
+        notes = self.notes
+        color_map = self._note_color_map
+        default_bg = color_map["default"]
+        
+        self._titles = [n.title or _UNTITLED for n in notes]
+        self._previews = [_format_preview(n.plain_content) for n in notes]
+        self._dates_fmt = [n.modified_date.strftime(DATE_DISPLAY_FORMAT) for n in notes]
+        self._colors_bg = [color_map.get(n.color or "default", default_bg) for n in notes]
+        self._pins = [bool(n.is_pinned) for n in notes]
+        
+        # Rows may have moved or changed, so every pool slot must be redrawn
+        self._slot_rows = [None] * len(self._row_pool)
+        
+        # Cached search results may no longer reflect the notes
+        self._last_search = ("", [])
+    
+    def _update_note_cache_row(self, row):
+        """
+        Refresh the cached display fields of a single note
+        
+        Args:
+            row (int): Index of the note in self.notes
+        """
+        note = self.notes[row]
+        self._titles[row] = note.title or _UNTITLED
+        self._previews[row] = _format_preview(note.plain_content)
+        self._dates_fmt[row] = note.modified_date.strftime(DATE_DISPLAY_FORMAT)
+        self._colors_bg[row] = self._note_color_map.get(note.color or "default", 
+                                                        self._note_color_map["default"])
+        self._pins[row] = bool(note.is_pinned)
+        self._last_search = ("", [])
+    
     def render_notes(self, notes_to_display=None):
         """
         Render the notes list
         
+        Only the rows scrolled into view get widgets, drawn from a small pool
+        that is reused as the list scrolls (see _refresh_visible_rows).
+        
         Args:
             notes_to_display: Optional list of notes to display. If None, displays all notes
         """
-        # Clear existing notes
-        for widget in self.note_items_frame.winfo_children():
-            widget.destroy()
-        
-        # Determine which notes to render
-        notes_to_render = notes_to_display if notes_to_display is not None else self.notes
-        
-        # Check if we have notes to display
-        if not notes_to_render:
-            # Show empty state
-            empty_label = ttk.Label(
-                self.note_items_frame,
-                text="No notes found",
-                font=self.theme_manager.text_font,
-                padding=20
-            )
-            empty_label.pack(pady=20)
-            
+        # Determine which notes to render, as rows in the display caches
+        if notes_to_display is None:
+            self._display_rows = list(range(len(self.notes)))
+        else:
+            id_to_index = self._id_to_index
+            self._display_rows = [id_to_index[note.id] for note in notes_to_display]
+        total = len(self._display_rows)
+        
+        # Size the scroll range for every displayed note, then fill the visible part
+        self.notes_canvas.configure(scrollregion=(0, 0, 0, max(total, 1) * NOTE_ITEM_HEIGHT))
+        
+        # Show empty state if we have no notes to display
+        self.notes_canvas.itemconfigure(self._empty_item, 
+                                        state=tk.HIDDEN if total else tk.NORMAL)
+        
+        self.notes_canvas.yview_moveto(0)
+        self._refresh_visible_rows()
+        
+        if not total:
             # Disable editor
             self.disable_editor()
             return
         
-        # Create note items
-        for i, note in enumerate(notes_to_render):
-            self.create_note_item(note, i)
-        
         # Select the first note if none is selected
-        if self.current_note is None and notes_to_render:
-            self.select_note(0)
+        if self.current_note is None:
+            self.select_note(self._display_rows[0])
     
-    def create_note_item(self, note, index):
-        """Create a single note item in the notes list"""
-        # Create frame for the note item
-        item_frame = ttk.Frame(self.note_items_frame, style="NoteItem.TFrame")
-        item_frame.pack(fill=tk.X, padx=5, pady=(0, 1))
+    @contextmanager
+    def _batch_list_updates(self, frame):
+        """
+        Unmap a list frame while its rows are changed
+        
+        Tk skips geometry propagation for an unmapped frame, so changing many
+        rows costs one relayout when the frame is re-packed instead of one per row.
+        The frame is re-packed with its original options, so it must be the last
+        packed child of its parent.
         
-        # Configure background color based on note color
-        background = self.theme_manager.get_note_color(note.color or "default")
+        Args:
+            frame: The packed frame to unmap
+        """
+        pack_options = frame.pack_info()
+        frame.pack_forget()
+        try:
+            yield
+        finally:
+            frame.pack(**pack_options)
+    
+    def _refresh_visible_rows(self):
+        """
+        Bind pooled row widgets to the notes scrolled into view
         
-        # Create the note item canvas for custom styling
+        Display index i always uses pool slot i % len(pool), so scrolling by one
+        row only redraws the slot that wrapped around. The pool grows to cover
+        the visible window plus overscan and is never larger.
+        """
+        total = len(self._display_rows)
+        top = int(self.notes_canvas.canvasy(0))
+        bottom = top + self.notes_canvas.winfo_height()
+        first = max(0, top // NOTE_ITEM_HEIGHT - NOTE_LIST_OVERSCAN)
+        last = min(total, bottom // NOTE_ITEM_HEIGHT + 1 + NOTE_LIST_OVERSCAN)
+        
+        # Grow the pool on demand
+        while len(self._row_pool) < last - first:
+            self._create_pool_row()
+        pool_size = len(self._row_pool)
+        
+        visible_slots = set()
+        for display_index in range(first, last):
+            slot = display_index % pool_size
+            visible_slots.add(slot)
+            
+            row = self._display_rows[display_index]
+            if self._slot_rows[slot] != row:
+                self._slot_rows[slot] = row
+                self._draw_slot(slot)
+            
+            # The canvas maps each item relative to the view, so only the
+            # virtual y offset grows with the list
+            y = display_index * NOTE_ITEM_HEIGHT
+            if self._slot_y[slot] != y:
+                if self._slot_y[slot] is None:
+                    self.notes_canvas.itemconfigure(self._slot_items[slot], state=tk.NORMAL)
+                self._slot_y[slot] = y
+                self.notes_canvas.coords(self._slot_items[slot], 5, y)
+        
+        # Hide slots that scrolled out of the window
+        for slot in range(pool_size):
+            if slot not in visible_slots and self._slot_y[slot] is not None:
+                self.notes_canvas.itemconfigure(self._slot_items[slot], state=tk.HIDDEN)
+                self._slot_y[slot] = None
+                self._slot_rows[slot] = None
+    
+    def _create_pool_row(self):
+        """Create a reusable note item canvas and add it to the row pool"""
+        slot = len(self._row_pool)
         item_canvas = tk.Canvas(
-            item_frame,
-            background=background,
+            self.notes_canvas,
             highlightthickness=1,
             highlightbackground=self.colors["border"],
-            height=80
+            borderwidth=0
         )
-        item_canvas.pack(fill=tk.X, expand=True)
-        
-        # Add pin indicator if pinned
-        if note.is_pinned:
-            item_canvas.create_text(
-                10, 10,
-                text="📌",
-                anchor=tk.NW,
-                fill=self.colors["accent"]
-            )
-        
-        # Add title
-        title_text = note.title or "Untitled"
-        item_canvas.create_text(
-            20, 15,
-            text=title_text,
+        item = self.notes_canvas.create_window(
+            5, 0,
+            window=item_canvas,
             anchor=tk.NW,
-            font=self.theme_manager.bold_font,
-            fill=self.colors["fg"]
+            width=max(self.notes_canvas.winfo_width() - 10, 1),
+            height=NOTE_ITEM_HEIGHT - 1,
+            state=tk.HIDDEN
         )
         
-        # Add preview of content
-        preview_text = note.plain_content or ""
-        if len(preview_text) > 100:
-            preview_text = preview_text[:100] + "..."
+        # Bind click event
+        item_canvas.bind("<Button-1>", lambda e, s=slot: self._on_slot_click(s))
         
-        item_canvas.create_text(
-            20, 40,
-            text=preview_text,
-            anchor=tk.NW,
-            font=self.theme_manager.small_font,
-            fill=self.colors["fg"],
-            width=item_canvas.winfo_width() - 40
-        )
+        # Redraw the note item when the canvas is resized
+        item_canvas.bind("<Configure>", lambda e, s=slot: self._draw_slot(s))
         
-        # Add date
-        date_text = note.modified_date.strftime("%b %d, %Y %H:%M")
-        item_canvas.create_text(
-            item_canvas.winfo_width() - 10, 70,
-            text=date_text,
-            anchor=tk.SE,
-            font=self.theme_manager.small_font,
-            fill=self.colors["fg"]
-        )
+        self._row_pool.append(item_canvas)
+        self._slot_items.append(item)
+        self._slot_rows.append(None)
+        self._slot_y.append(None)
+    
+    def _on_slot_click(self, slot):
+        """Select the note currently shown in a pool slot"""
+        row = self._slot_rows[slot]
+        if row is not None:
+            self.select_note(row)
+    
+    def _draw_slot(self, slot):
+        """
+        Draw the note bound to a pool slot, including its selection highlight
         
-        # Bind click event
-        item_canvas.bind("<Button-1>", lambda e, idx=index: self.select_note(idx))
+        Args:
+            slot (int): Index into the row pool
+        """
+        row = self._slot_rows[slot]
+        if row is None:
+            return
         
-        # Update note item when canvas is resized
-        item_canvas.bind("<Configure>", lambda e, canvas=item_canvas, title=title_text, 
-                                              preview=preview_text, date=date_text, 
-                                              pinned=note.is_pinned: 
-                                          self.update_note_item(canvas, title, preview, date, pinned))
+        item_canvas = self._row_pool[slot]
+        if row == self.selected_note_index:
+            item_canvas.configure(background=self._colors_bg[row], 
+                                  highlightbackground=self.colors["accent"], highlightthickness=2)
+        else:
+            item_canvas.configure(background=self._colors_bg[row], 
+                                  highlightbackground=self.colors["border"], highlightthickness=1)
+        self.update_note_item(item_canvas, row)
     
-    def update_note_item(self, canvas, title, preview, date, pinned):
-        """Update note item canvas when resized"""
+    def _redraw_row(self, row):
+        """
+        Redraw a note if it is currently on screen
+        
+        Args:
+            row (int): Index of the note in self.notes
+        """
+        for slot, slot_row in enumerate(self._slot_rows):
+            if slot_row == row:
+                self._draw_slot(slot)
+    
+    def update_note_item(self, canvas, row):
+        """
+        Redraw a note item canvas from the display caches
+        
+        Args:
+            canvas (tk.Canvas): The note item canvas
+            row (int): Index of the note in the display caches
+        """
         # Clear canvas
         canvas.delete("all")
         
+        # Query the width once; each winfo call is a Tcl round trip
+        width = canvas.winfo_width()
+        
         # Redraw contents
-        if pinned:
+        if self._pins[row]:
             canvas.create_text(
                 10, 10,
                 text="📌",
@@ -670,7 +970,7 @@ class MainWindow:
         
         canvas.create_text(
             20, 15,
-            text=title,
+            text=self._titles[row],
             anchor=tk.NW,
             font=self.theme_manager.bold_font,
             fill=self.colors["fg"]
@@ -678,16 +978,16 @@ class MainWindow:
         
         canvas.create_text(
             20, 40,
-            text=preview,
+            text=self._previews[row],
             anchor=tk.NW,
             font=self.theme_manager.small_font,
             fill=self.colors["fg"],
-            width=canvas.winfo_width() - 40
+            width=width - 40
         )
         
         canvas.create_text(
-            canvas.winfo_width() - 10, 70,
-            text=date,
+            width - 10, 70,
+            text=self._dates_fmt[row],
             anchor=tk.SE,
             font=self.theme_manager.small_font,
             fill=self.colors["fg"]
@@ -707,15 +1007,14 @@ class MainWindow:
         self.current_note = self.notes[index]
         
         # Highlight selected note in the list
-        for i, frame in enumerate(self.note_items_frame.winfo_children()):
-            if i == index:
-                for child in frame.winfo_children():
-                    if isinstance(child, tk.Canvas):
-                        child.configure(highlightbackground=self.colors["accent"], highlightthickness=2)
+        for slot, row in enumerate(self._slot_rows):
+            if row is None:
+                continue
+            canvas = self._row_pool[slot]
+            if row == index:
+                canvas.configure(highlightbackground=self.colors["accent"], highlightthickness=2)
             else:
-                for child in frame.winfo_children():
-                    if isinstance(child, tk.Canvas):
-                        child.configure(highlightbackground=self.colors["border"], highlightthickness=1)
+                canvas.configure(highlightbackground=self.colors["border"], highlightthickness=1)
         
         # Update editor with note content
         self.update_editor()
@@ -758,6 +1057,10 @@ class MainWindow:
             date_text = f"Modified: {self.current_note.modified_date.strftime('%b %d, %Y %H:%M')}"
             self.modified_label.configure(text=date_text)
         
+        # Freshly loaded content is not dirty
+        self.text_editor.edit_modified(False)
+        self._dirty = False
+        
         # Reset editing flag
         self.is_editing = True
         
@@ -807,7 +1110,7 @@ class MainWindow:
         
         # Create a new note
         new_note = Note.create(
-            title="Untitled",
+            title=_UNTITLED,
             content="",
             plain_content="",
             color="default"
@@ -815,6 +1118,9 @@ class MainWindow:
         
         # Add to notes list
         self.notes.insert(0, new_note)
+        self._index_note(new_note)
+        self._reindex()
+        self._rebuild_note_cache()
         
         # Refresh the notes list
         self.render_notes()
@@ -830,13 +1136,22 @@ class MainWindow:
         if not self.current_note or not self.is_editing:
             return
         
-        # Get content
-        title = self.title_var.get()
-        content = self.text_editor.get("1.0", tk.END).strip()
-        plain_content = content  # In a full implementation, strip formatting for search
+        # Skip the save entirely if nothing changed since the last load or save
+        if not self._dirty:
+            return
+        
+        text_modified = self.text_editor.edit_modified()
         color = self.color_var.get()
         is_pinned = self.pin_var.get()
         
+        # Get content, only crossing into Tk for the text if it was edited
+        title = self.title_var.get()
+        content = None
+        if text_modified:
+            content = self.text_editor.get("1.0", tk.END).strip()
+            self.text_editor.edit_modified(False)
+        plain_content = content  # In a full implementation, strip formatting for search
+        
         # Update note
         self.current_note.update(
             title=title,
@@ -845,29 +1160,38 @@ class MainWindow:
             color=color,
             is_pinned=is_pinned
         )
+        self._dirty = False
+        
+        # Keep the in-memory note and search indexes in step with what was saved
+        self.current_note.title = title
+        if content is not None:
+            self.current_note.content = content
+            self.current_note.plain_content = plain_content
+        self.current_note.color = color
+        old_modified = self.current_note.modified_date
+        self.current_note.modified_date = datetime.datetime.now()
+        self._move_to_most_recent(self.current_note, old_modified)
+        self._unindex_note(self.current_note.id)
+        self._index_note(self.current_note)
         
         # Update note in list if needed (for title or pinned status changes)
         if self.selected_note_index >= 0:
             # Re-sort notes if pinned status changed
             if is_pinned != self.notes[self.selected_note_index].is_pinned:
-                # Get the note ID
-                note_id = self.current_note.id
-                
-                # Reload notes to get proper sorting
-                self.notes = Note.get_all()
+                self.current_note.is_pinned = is_pinned
                 
-                # Find the note in the new list
-                for i, note in enumerate(self.notes):
-                    if note.id == note_id:
-                        self.selected_note_index = i
-                        self.current_note = note
-                        break
+                # Re-sort in memory, matching Note.get_all's pinned-first ordering
+                self.notes.sort(key=lambda n: (not n.is_pinned, -n.modified_date.timestamp()))
+                self._reindex()
+                self.selected_note_index = self._id_to_index[self.current_note.id]
+                self._rebuild_note_cache()
                 
                 # Re-render the list
                 self.render_notes()
             else:
                 # Just update the current item
-                self.create_note_item(self.current_note, self.selected_note_index)
+                self._update_note_cache_row(self.selected_note_index)
+                self._redraw_row(self.selected_note_index)
         
         # Update status
         self.status_label.configure(text="Note saved")
@@ -885,9 +1209,12 @@ class MainWindow:
             
             # Delete from database
             Note.delete(note_id)
+            self._unindex_note(note_id)
             
             # Remove from list
             self.notes.pop(self.selected_note_index)
+            self._reindex()
+            self._rebuild_note_cache()
             
             # Reset current note
             self.current_note = None
@@ -898,13 +1225,21 @@ class MainWindow:
     
     def on_search_changed(self, varname, index, mode):
         """
-        Handle search input changes and filter notes list
+        Handle search input changes, coalescing bursts of keystrokes into one filter pass
         
         Args:
             varname: Variable name that changed (from trace_add)
             index: Index in the variable that changed
             mode: Type of change (write, read, etc.)
         """
+        # Restart the debounce timer so only the last keystroke in a burst filters
+        if self._search_job:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(SEARCH_DEBOUNCE_MS, self._apply_search_filter)
+    
+    def _apply_search_filter(self):
+        """Filter the notes list by the current search text"""
+        self._search_job = None
         search_text = self.search_var.get().lower()
         
         # Skip filtering if the search box contains the placeholder text
@@ -913,19 +1248,88 @@ class MainWindow:
         
         # If search is empty, show all notes
         if not search_text:
-            self.render_notes()
+            self.render_notes(self.notes)
             return
         
-        # Filter notes based on search text
-        filtered_notes = []
-        for note in self.notes:
-            # Search in title and content
-            if (search_text in note.title.lower() or 
-                (note.plain_content and search_text in note.plain_content.lower())):
-                filtered_notes.append(note)
+        # A longer query can only match a subset of the previous results
+        last_query, last_results = self._last_search
+        if last_query and search_text.startswith(last_query):
+            candidates = last_results
+        else:
+            candidates = self.notes
+        
+        # Narrow candidates to notes containing every trigram of the query
+        if len(search_text) >= 3:
+            postings = [self._trigrams.get(trigram, set()) for trigram in _trigrams(search_text)]
+            postings.sort(key=len)
+            candidate_ids = postings[0].intersection(*postings[1:])
+            candidates = [note for note in candidates if note.id in candidate_ids]
+        
+        # Verify candidates against the lowercased title and content; the index
+        # lookup and query are bound to locals to keep attribute lookups out of the loop
+        get_entry = self._search_index.__getitem__
+        query_bytes = search_text.encode("utf-8")
+        filtered_notes = [
+            note for note in candidates
+            if query_bytes in (entry := get_entry(note.id))[0] or query_bytes in entry[1]
+        ]
+        self._last_search = (search_text, filtered_notes)
         
         # Update the notes list with filtered results
-        self.render_notes(filtered_notes)
+        self.render_notes(self._rank_matches(search_text, filtered_notes))
+    
+    def _title_prefix_ids(self, prefix):
+        """
+        Find the notes whose lowercased title starts with a prefix
+        
+        Args:
+            prefix (str): Lowercased prefix
+            
+        Returns:
+            Set[str]: IDs of the matching notes
+        """
+        sorted_titles = self._sorted_titles
+        i = bisect.bisect_left(sorted_titles, (prefix,))
+        ids = set()
+        while i < len(sorted_titles) and sorted_titles[i][0].startswith(prefix):
+            ids.add(sorted_titles[i][1])
+            i += 1
+        return ids
+    
+    def _rank_matches(self, search_text, matches):
+        """
+        Order search matches: title starts with the query, then a word starts with it, then the rest
+        
+        Word-prefix hits come from the database's full-text index and only
+        reorder the substring matches; they never add or drop notes. The index
+        is skipped for short queries and when there is nothing to reorder.
+        
+        Args:
+            search_text (str): Lowercased query
+            matches: Matching notes, in list order
+            
+        Returns:
+            List[Note]: The same notes, best matches first, otherwise in list order
+        """
+        if len(matches) < 2:
+            return matches
+        
+        title_ids = self._title_prefix_ids(search_text)
+        word_ids = set()
+        if len(search_text) >= FTS_RANK_MIN_LENGTH and search_text.isalnum():
+            word_ids = set(Note.match_prefix_ids(search_text) or ())
+        if not title_ids and not word_ids:
+            return matches
+        
+        ranked = [[], [], []]
+        for note in matches:
+            if note.id in title_ids:
+                ranked[0].append(note)
+            elif note.id in word_ids:
+                ranked[1].append(note)
+            else:
+                ranked[2].append(note)
+        return ranked[0] + ranked[1] + ranked[2]
     
     def on_search_focus_in(self, event):
         """Handle focus entering the search box"""
@@ -939,55 +1343,79 @@ class MainWindow:
 
     def on_search_return(self, event):
         """Handle Enter key in search box"""
-        # Same as on_search_changed but forces update
-        search_text = self.search_var.get().lower()
-        
-        if not search_text or search_text == "search notes...":
-            self.render_notes()
-            return
-        
-        filtered_notes = []
-        for note in self.notes:
-            if (search_text in note.title.lower() or 
-                (note.plain_content and search_text in note.plain_content.lower())):
-                filtered_notes.append(note)
-        
-        self.render_notes(filtered_notes)
+        # Filter immediately instead of waiting for the debounce timer
+        if self._search_job:
+            self.root.after_cancel(self._search_job)
+        self._apply_search_filter()
 
     def update_categories_list(self):
         """Update the categories list in the sidebar"""
-        # Clear existing categories
-        for widget in self.categories_list_frame.winfo_children():
-            widget.destroy()
-        
-        # Add each category
-        for category in self.categories:
-            cat_btn = ttk.Button(
-                self.categories_list_frame,
-                text=category.name,
-                command=lambda c=category: self.filter_by_category(c),
-                style="Sidebar.TButton"
-            )
-            cat_btn.pack(fill=tk.X, padx=0, pady=1)
+        self._cat_buttons = self._sync_sidebar_buttons(
+            self.categories_list_frame, self._cat_buttons, self._cat_items,
+            self.categories, self.filter_by_category
+        )
     
     def update_tags_list(self):
         """Update the tags list in the sidebar"""
-        # Clear existing tags
-        for widget in self.tags_list_frame.winfo_children():
-            widget.destroy()
-        
-        # Add each tag
-        for tag in self.tags:
-            tag_btn = ttk.Button(
-                self.tags_list_frame,
-                text=tag.name,
-                command=lambda t=tag: self.filter_by_tag(t),
-                style="Sidebar.TButton"
-            )
-            tag_btn.pack(fill=tk.X, padx=0, pady=1)
+        self._tag_buttons = self._sync_sidebar_buttons(
+            self.tags_list_frame, self._tag_buttons, self._tag_items,
+            self.tags, self.filter_by_tag
+        )
+    
+    def _sync_sidebar_buttons(self, frame, buttons, items_by_id, items, command):
+        """
+        Bring a sidebar button list in line with its items, reusing existing buttons
+        
+        Args:
+            frame: Frame holding the buttons
+            buttons (Dict[str, ttk.Button]): Current buttons keyed by item ID, in display order
+            items_by_id (Dict[str, Any]): Item lookup used by button clicks; refreshed in place
+            items: Categories or tags to show, in order
+            command: Callback that receives the clicked item
+            
+        Returns:
+            Dict[str, ttk.Button]: Buttons keyed by item ID, in display order
+        """
+        # Destroy buttons whose item is gone
+        current_ids = {item.id for item in items}
+        for item_id in set(buttons) - current_ids:
+            buttons.pop(item_id).destroy()
+        
+        # Clicks look the item up by ID, so a button's command never needs replacing
+        # (each configure(command=...) would register another Tcl command)
+        items_by_id.clear()
+        items_by_id.update((item.id, item) for item in items)
+        
+        # Create buttons for new items; refresh the rest in case of a rename
+        old_order = list(buttons)
+        synced = {}
+        for item in items:
+            button = buttons.get(item.id)
+            if button is None:
+                button = ttk.Button(
+                    frame,
+                    text=item.name,
+                    command=lambda item_id=item.id: command(items_by_id[item_id]),
+                    style="Sidebar.TButton"
+                )
+            else:
+                button.configure(text=item.name)
+            synced[item.id] = button
+        
+        # Re-pack only when buttons were added or reordered, in one relayout
+        if list(synced) != old_order:
+            with self._batch_list_updates(frame):
+                for button in synced.values():
+                    button.pack_forget()
+                for button in synced.values():
+                    button.pack(fill=tk.X, padx=0, pady=1)
+        
+        return synced
     
     def add_category(self):
         """Add a new category"""
+        from tkinter import simpledialog
+        
         # Simple dialog to get category name
         category_name = simpledialog.askstring("New Category", "Enter category name:")
         if not category_name:
@@ -1002,6 +1430,8 @@ class MainWindow:
     
     def add_tag(self):
         """Add a new tag"""
+        from tkinter import simpledialog
+        
         # Simple dialog to get tag name
         tag_name = simpledialog.askstring("New Tag", "Enter tag name:")
         if not tag_name:
@@ -1023,19 +1453,18 @@ class MainWindow:
         """
         if view_type == "all":
             self.view_label.configure(text="All Notes")
-            self.render_notes()
+            self.render_notes(self.notes)
         
         elif view_type == "recent":
             self.view_label.configure(text="Recent Notes")
-            # Get notes from the last 7 days
-            one_week_ago = datetime.datetime.now() - datetime.timedelta(days=7)
-            recent_notes = [n for n in self.notes if n.modified_date > one_week_ago]
-            self.render_notes(recent_notes)
+            # Notes modified within RECENT_VIEW_AGE are a prefix of the recency-ordered list
+            cutoff = datetime.datetime.now() - RECENT_VIEW_AGE
+            end = bisect.bisect_left(self._modified_keys, -cutoff.timestamp())
+            self.render_notes(self._by_modified_desc[:end])
         
         elif view_type == "pinned":
             self.view_label.configure(text="Pinned Notes")
-            pinned_notes = [n for n in self.notes if n.is_pinned]
-            self.render_notes(pinned_notes)
+            self.render_notes(self._pinned_notes)
     
     def filter_by_category(self, category):
         """Filter notes by category"""
@@ -1050,8 +1479,9 @@ class MainWindow:
         # Filter notes by tag (assuming note-tag relationships)
         # This would need more logic to handle note-tag relationships
         # For simplicity, we'll just filter by tag name appearing in content
-        filtered_notes = [n for n in self.notes if 
-                          tag.name.lower() in (n.plain_content or "").lower()]
+        tag_bytes = tag.name.lower().encode("utf-8")
+        get_entry = self._search_index.__getitem__
+        filtered_notes = [n for n in self.notes if tag_bytes in get_entry(n.id)[1]]
         self.render_notes(filtered_notes)
     
     def toggle_theme(self):
@@ -1060,6 +1490,8 @@ class MainWindow:
         
         # Update UI colors
         self.colors = self.theme_manager.get_current_theme_colors()
+        self._note_color_map = dict(self.colors["note_colors"])
+        self._rebuild_note_cache()
         
         # Refresh the UI
         self.render_notes()
@@ -1078,32 +1510,53 @@ class MainWindow:
         """Toggle the pinned status of the current note"""
         if not self.current_note:
             return
-            
-        self.current_note.is_pinned = self.pin_var.get()
+        
+        self._dirty = True
         self.save_current_note()
     
     def on_title_changed(self, event):
         """Handle title changes"""
         if self.is_editing and self.current_note:
-            self.current_note.title = self.title_var.get()
-            self.status_label.configure(text="Editing...")
-            
-            # Restart autosave timer if exists
-            self.setup_autosave()
+            # The title is read from title_var when the note is saved
+            self._dirty = True
+            self._schedule_autosave()
+    
+    def _on_title_var_write(self, varname, index, mode):
+        """
+        Mark the note dirty when the user edits its title
+        
+        Args:
+            varname: Variable name that changed (from trace_add)
+            index: Index in the variable that changed
+            mode: Type of change (write, read, etc.)
+        """
+        if self.is_editing and self.current_note:
+            self._dirty = True
+            self._schedule_autosave()
     
     def on_text_changed(self, event):
         """Handle text changes"""
         if self.is_editing and self.current_note:
-            self.status_label.configure(text="Editing...")
-            
-            # Restart autosave timer
-            self.setup_autosave()
+            self._dirty = True
+            self._schedule_autosave()
     
     def on_color_changed(self, event):
         """Handle color changes"""
         if self.is_editing and self.current_note:
+            # Recolor the list row now; the database write waits for autosave
             self.current_note.color = self.color_var.get()
-            self.save_current_note()
+            if self.selected_note_index >= 0:
+                self._update_note_cache_row(self.selected_note_index)
+                self._redraw_row(self.selected_note_index)
+            
+            self._dirty = True
+            self._schedule_autosave()
+    
+    def _on_text_modified(self, event):
+        """Mark the note dirty on text edits that don't come from a key release, such as paste"""
+        if self.is_editing and self.current_note and self.text_editor.edit_modified():
+            self._dirty = True
+            self._schedule_autosave()
     
     def setup_autosave(self):
         """Set up autosave timer"""
@@ -1114,14 +1567,37 @@ class MainWindow:
         # Set up new timer
         self.autosave_timer = self.root.after(30000, self.autosave)  # 30 seconds
     
+    def _schedule_autosave(self):
+        """Show that there are unsaved edits and arm the autosave timer, unless it is already pending"""
+        self.status_label.configure(text="Editing...")
+        if self.autosave_timer:
+            return
+        
+        self.autosave_timer = self.root.after(30000, self.autosave)
+    
+    def save_all_notes(self):
+        """Save any unsaved edits, e.g. before the application closes"""
+        self.save_current_note()
+    
+    def shutdown(self):
+        """Finish pending file writes and stop the I/O thread before the application closes"""
+        self._io_executor.shutdown(wait=True)
+    
     def autosave(self):
         """Automatically save current note"""
+        self.autosave_timer = None
+        
+        # Nothing to write; the next edit restarts the timer
+        if not self._dirty:
+            return
+        
         if self.is_editing and self.current_note:
             self.save_current_note()
             self.status_label.configure(text="Autosaved")
-            
-        # Reset timer
-        self.setup_autosave()
+        
+        # Keep the timer running only while edits remain unsaved
+        if self._dirty:
+            self.setup_autosave()
     
     def format_bold(self):
         """Apply bold formatting to selected text"""
@@ -1189,21 +1665,71 @@ class MainWindow:
         if not self.current_note:
             return
             
+        from tkinter import filedialog
+        
+        # The title entry may hold edits not yet saved to the note
+        title = self.title_var.get()
+        
         # Ask for file location
         file_path = filedialog.asksaveasfilename(
             defaultextension=".txt",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-            initialfile=f"{self.current_note.title}.txt"
+            initialfile=f"{title}.txt"
         )
         
         if not file_path:
             return
-            
-        try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(f"{self.current_note.title}\n\n")
-                f.write(self.text_editor.get("1.0", tk.END))
-            
-            self.status_label.configure(text=f"Exported to {os.path.basename(file_path)}")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Could not export note: {e}")
+        
+        # Read widget state here; the write itself happens on the I/O thread
+        header = f"{title}\n\n"
+        body = self.text_editor.get("1.0", tk.END)
+        self.status_label.configure(text=f"Exporting to {os.path.basename(file_path)}...")
+        
+        future = self._io_executor.submit(self._write_export, file_path, header, body)
+        self.root.after(IO_POLL_MS, self._poll_export, future, file_path)
+    
+    def _poll_export(self, future, file_path):
+        """
+        Report an export once its write finishes, checking from the Tk thread
+        
+        Tk must only be called from its own thread, so the worker never
+        schedules callbacks itself; if the window is destroyed first, the
+        pending poll is simply dropped.
+        
+        Args:
+            future (concurrent.futures.Future): The pending write
+            file_path (str): Destination file path
+        """
+        if not future.done():
+            self.root.after(IO_POLL_MS, self._poll_export, future, file_path)
+            return
+        
+        self._on_export_done(file_path, future.exception())
+    
+    def _write_export(self, file_path, header, body):
+        """
+        Write an exported note to disk (runs on the I/O thread)
+        
+        Args:
+            file_path (str): Destination file path
+            header (str): Title header written before the body
+            body (str): Note text
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(header)
+            f.write(body)
+    
+    def _on_export_done(self, file_path, error):
+        """
+        Report the result of an export on the UI thread
+        
+        Args:
+            file_path (str): Destination file path
+            error (Optional[BaseException]): Exception raised by the write, if any
+        """
+        if error is not None:
+            self.status_label.configure(text="Export failed")
+            messagebox.showerror("Export Error", f"Could not export note: {error}")
+            return
+        
+        self.status_label.configure(text=f"Exported to {os.path.basename(file_path)}")
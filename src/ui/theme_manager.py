@@ -7,11 +7,12 @@ custom styling for widgets, and integration with ttkthemes.
 
 import os
 import sys
+import time
 import logging
 import subprocess
 import tkinter as tk
 from tkinter import ttk, font
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 # Import application settings
 from src.config import settings
@@ -91,6 +92,9 @@ class ThemeManager:
         "dark": "equilux"  # Dark theme
     }
     
+    # Seconds a detected system theme is reused before probing the desktop again
+    SYSTEM_THEME_CACHE_TTL = 5.0
+    
     def __init__(self, root, app_settings: Dict[str, Any]):
         """
         Initialize the theme manager
@@ -104,6 +108,23 @@ class ThemeManager:
         self.current_theme_mode = None
         self.style = ttk.Style()
         
+        # Non-ttk widgets whose colors must be set directly, grouped by kind (see register)
+        self._theme_sinks: Dict[str, List[tk.Widget]] = {
+            "bg": [],
+            "bg_fg": [],
+            "entry": [],
+            "text": [],
+            "listbox": []
+        }
+        
+        # Palettes of the applied theme, set by apply_theme
+        self._active_colors: Dict[str, Any] = self.LIGHT_THEME
+        self._active_note_colors: Dict[str, str] = self.LIGHT_THEME["note_colors"]
+        
+        # Last detected system theme and when it was detected (time.monotonic)
+        self._cached_system_theme: Optional[str] = None
+        self._cached_at: float = 0.0
+        
         # Determine initial theme based on settings
         self.use_system_theme = app_settings.get("use_system_theme", True)
         self.dark_mode = app_settings.get("dark_mode", False)
@@ -136,6 +157,26 @@ class ThemeManager:
                 self.TTK_THEMES["dark"] = self.TTK_THEMES["light"]
     
     def get_system_theme(self) -> str:
+        """
+        Get the system theme (light or dark), reusing a recent detection
+        
+        Detection can spawn subprocesses, so the result is cached for
+        SYSTEM_THEME_CACHE_TTL seconds.
+        
+        Returns:
+            str: "light" or "dark"
+        """
+        now = time.monotonic()
+        if self._cached_system_theme is None or now - self._cached_at >= self.SYSTEM_THEME_CACHE_TTL:
+            self._cached_system_theme = self._detect_system_theme()
+            self._cached_at = now
+        return self._cached_system_theme
+    
+    def invalidate_system_theme(self):
+        """Forget the cached system theme so the next lookup detects it again"""
+        self._cached_system_theme = None
+    
+    def _detect_system_theme(self) -> str:
         """
         Detect the system theme (light or dark)
         
@@ -239,6 +280,10 @@ class ThemeManager:
         # Apply additional styling based on the selected theme
         theme_colors = self.DARK_THEME if theme_mode == "dark" else self.LIGHT_THEME
         
+        # Resolve the active palettes once so per-note lookups are a single dict get
+        self._active_colors = theme_colors
+        self._active_note_colors = theme_colors["note_colors"]
+        
         # Configure TTK styles for custom widgets
         self.style.configure("TLabel", background=theme_colors["bg"], foreground=theme_colors["fg"])
         self.style.configure("TFrame", background=theme_colors["bg"])
@@ -262,60 +307,62 @@ class ThemeManager:
         self.style.configure("NoteItem.TLabel", background=theme_colors["item_bg"], 
                             foreground=theme_colors["fg"])
         
+        # Entry styles
+        self.style.configure("TEntry", fieldbackground=theme_colors["bg"], 
+                            foreground=theme_colors["fg"], insertcolor=theme_colors["fg"])
+        
         # Configure the root window
         self.root.configure(background=theme_colors["bg"])
         
-        # Configure colors on all existing ttk widgets
-        for widget in self.root.winfo_children():
-            self._configure_widget_theme(widget, theme_colors)
+        # ttk widgets follow the styles above; only registered tk widgets need configuring
+        for kind, widgets in self._theme_sinks.items():
+            options = self._sink_options(kind, theme_colors)
+            for widget in widgets:
+                try:
+                    widget.configure(**options)
+                except tk.TclError:
+                    # The widget has been destroyed
+                    pass
     
-    def _configure_widget_theme(self, widget, theme_colors: Dict[str, str]):
+    def register(self, widget, kind: str):
         """
-        Recursively configure theme for all widgets
+        Register a non-ttk widget to be recolored whenever the theme changes
+        
+        ttk widgets are themed through named styles and don't need registering.
         
         Args:
-            widget: The widget to configure
-            theme_colors: Dictionary of theme colors
+            widget: A tk widget
+            kind (str): Which colors the widget takes: "bg" (Frame, Canvas),
+                "bg_fg" (Label), "entry", "text" or "listbox"
         """
-        try:
-            # Configure based on widget type
-            widget_name = widget.winfo_class()
-            
-            if widget_name in ("Frame", "Labelframe", "TFrame", "TLabelframe"):
-                widget.configure(background=theme_colors["bg"])
-            
-            elif widget_name in ("Label", "TLabel"):
-                widget.configure(background=theme_colors["bg"], foreground=theme_colors["fg"])
-            
-            elif widget_name in ("Button", "TButton"):
-                # Skip configurating buttons directly as they're handled by the style
-                pass
-            
-            elif widget_name in ("Entry", "TEntry"):
-                # For text input fields
-                if hasattr(widget, "configure"):
-                    widget.configure(background=theme_colors["bg"], foreground=theme_colors["fg"], 
-                                   insertbackground=theme_colors["fg"])
-            
-            elif widget_name == "Text":
-                widget.configure(background=theme_colors["bg"], foreground=theme_colors["fg"],
-                               insertbackground=theme_colors["fg"])
-            
-            elif widget_name in ("Listbox", "TListbox"):
-                widget.configure(background=theme_colors["bg"], foreground=theme_colors["fg"],
-                               selectbackground=theme_colors["accent"], 
-                               selectforeground="white")
+        if kind not in self._theme_sinks:
+            raise ValueError(f"Unknown theme widget kind: {kind}")
         
-        except Exception:
-            # Some widgets might not support all configurations
-            pass
+        self._theme_sinks[kind].append(widget)
+        widget.configure(**self._sink_options(kind, self._active_colors))
+    
+    def _sink_options(self, kind: str, theme_colors: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Get the configure options for a kind of registered widget
         
-        # Process children recursively
-        try:
-            for child in widget.winfo_children():
-                self._configure_widget_theme(child, theme_colors)
-        except Exception:
-            pass
+        Args:
+            kind (str): Widget kind, as passed to register
+            theme_colors: Dictionary of theme colors
+            
+        Returns:
+            Dict[str, str]: Options to pass to widget.configure
+        """
+        options = {"background": theme_colors["bg"]}
+        if kind == "bg":
+            return options
+        
+        options["foreground"] = theme_colors["fg"]
+        if kind in ("entry", "text"):
+            options["insertbackground"] = theme_colors["fg"]
+        elif kind == "listbox":
+            options["selectbackground"] = theme_colors["accent"]
+            options["selectforeground"] = "white"
+        return options
     
     def setup_fonts(self):
         """Set up custom fonts for the application"""
@@ -339,6 +386,8 @@ class ThemeManager:
     
     def toggle_theme(self):
         """Toggle between light and dark theme"""
+        self.invalidate_system_theme()
+        
         # Determine the opposite of the current theme
         new_mode = "light" if self.current_theme_mode == "dark" else "dark"
         
@@ -366,6 +415,7 @@ class ThemeManager:
             follow (bool): Whether to follow system theme
         """
         self.use_system_theme = follow
+        self.invalidate_system_theme()
         
         # Apply theme based on system if follow is True
         if follow:
@@ -383,6 +433,7 @@ class ThemeManager:
         """
         self.dark_mode = dark_mode
         self.use_system_theme = False
+        self.invalidate_system_theme()
         
         # Apply the theme
         self.apply_theme("dark" if dark_mode else "light")
@@ -397,7 +448,7 @@ class ThemeManager:
         Returns:
             Dict[str, str]: Dictionary of color values
         """
-        return self.DARK_THEME if self.current_theme_mode == "dark" else self.LIGHT_THEME
+        return self._active_colors
     
     def get_note_color(self, color_name: str) -> str:
         """
@@ -409,5 +460,4 @@ class ThemeManager:
         Returns:
             str: Hex color value
         """
-        colors = self.get_current_theme_colors()["note_colors"]
-        return colors.get(color_name, colors["default"])
+        return self._active_note_colors.get(color_name, self._active_note_colors["default"])
@@ -3,12 +3,21 @@ C0lorNote Logger Module
 
 This module provides logging functionality for the C0lorNote application.
 It configures both console and file logging with appropriate formatting and rotation.
+
+Pass message arguments %-style (logger.debug("Loaded %s", path)) rather than
+as f-strings, so they are only formatted for records that are emitted. Guard
+debug messages whose arguments are expensive to compute with debug_enabled().
 """
 
 import os
 import sys
+import time
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import atexit
+import functools
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 # Import settings to get the config directory
@@ -22,25 +31,293 @@ DEFAULT_FILE_LEVEL = logging.DEBUG
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+
 # Log file settings
 MAX_LOG_SIZE = 5 * 1024 * 1024  # 5 MB
 BACKUP_COUNT = 3
 
+# File records are buffered and written in batches: when the buffer fills, when
+# an ERROR is logged, or at least every FILE_FLUSH_INTERVAL seconds
+FILE_BUFFER_CAPACITY = 512
+FILE_FLUSH_INTERVAL = 30.0
+FILE_WRITE_BUFFER = 64 * 1024  # bytes; the default is 8 KiB
+
+
+class CachedLogRecord(logging.LogRecord):
+    """
+    LogRecord that merges its message and arguments only once
+    
+    The console formatter and the file queue handler each call getMessage on
+    every record. The result is reused as long as msg and args are the same
+    objects, so handlers that rewrite them (as QueueHandler does) still get a
+    fresh message.
+    """
+    
+    _message_cache = None
+    
+    def getMessage(self):
+        """
+        Get the message with its arguments merged in
+        
+        Returns:
+            str: The merged message
+        """
+        msg, args = self.msg, self.args
+        cached = self._message_cache
+        if cached is not None and cached[0] is msg and cached[1] is args:
+            return cached[2]
+        
+        message = super().getMessage()
+        self._message_cache = (msg, args, message)
+        return message
+
+
+class _FastFormatter(logging.Formatter):
+    """
+    Formatter specialized for LOG_FORMAT
+    
+    Builds each line with a single f-string instead of going through the
+    generic style machinery. Records carrying exception or stack information
+    take the standard path so tracebacks are still rendered.
+    """
+    
+    def __init__(self):
+        super().__init__(LOG_FORMAT, DATE_FORMAT)
+        
+        # (second, formatted time) of the last record; stored as one tuple so
+        # threads never see a second paired with another second's text
+        self._last_time = (-1, "")
+    
+    def formatTime(self, record, datefmt=None):
+        """
+        Format a record's time, reusing the text for records in the same second
+        
+        DATE_FORMAT has one-second resolution, so strftime runs at most once per second.
+        
+        Args:
+            record (logging.LogRecord): The record being formatted
+            datefmt (str, optional): Ignored; DATE_FORMAT is always used
+            
+        Returns:
+            str: The formatted time
+        """
+        second = int(record.created)
+        last_second, text = self._last_time
+        if second != last_second:
+            text = time.strftime(DATE_FORMAT, self.converter(second))
+            self._last_time = (second, text)
+        return text
+    
+    def format(self, record):
+        """
+        Format a record as LOG_FORMAT would
+        
+        Args:
+            record (logging.LogRecord): The record to format
+            
+        Returns:
+            str: The formatted log line
+        """
+        if record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        # Must stay in step with LOG_FORMAT
+        return f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+
+
+# Shared by every handler; the format is fixed, so one formatter serves all
+_FORMATTER = _FastFormatter()
+
 
+class CachedSizeRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that keeps its own count of the log file size
+    
+    RotatingFileHandler seeks to the end of the file before every record to
+    decide whether to roll over. This handler adds up the encoded size of what
+    it writes instead, and only checks the real file size once that estimate
+    reaches maxBytes. A file is rotated once it has reached maxBytes rather than
+    before it would pass it, so it can exceed the limit by about one record.
+    """
+    
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        try:
+            self._bytes_written = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._bytes_written = 0
+    
+    def _open(self):
+        """Open the log file with a FILE_WRITE_BUFFER-sized buffer, so a batch is written in few syscalls"""
+        return open(self.baseFilename, self.mode, buffering=FILE_WRITE_BUFFER,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def format(self, record):
+        """Format a record, adding its length to the size estimate"""
+        msg = super().format(record)
+        # maxBytes is in encoded bytes; only non-ASCII text needs encoding to measure
+        size = len(msg) if msg.isascii() else len(msg.encode(self.encoding or "utf-8", "replace"))
+        self._bytes_written += size + len(self.terminator)
+        return msg
+    
+    def shouldRollover(self, record):
+        """
+        Decide whether to roll over before writing a record
+        
+        Args:
+            record (logging.LogRecord): The record about to be written
+            
+        Returns:
+            bool: True if the log file has reached maxBytes
+        """
+        if self.maxBytes <= 0 or self._bytes_written < self.maxBytes:
+            return False
+        
+        # The estimate reached the limit; confirm it against the file itself
+        if self.stream is None:
+            self.stream = self._open()
+        self._bytes_written = self.stream.seek(0, 2)
+        return self._bytes_written >= self.maxBytes
+    
+    def doRollover(self):
+        """Rotate the log files and restart the size count"""
+        super().doRollover()
+        self._bytes_written = 0
+    
+    def handle_batch(self, records):
+        """
+        Write a batch of records with one write and one flush
+        
+        Lines are collected and joined instead of being written and flushed
+        one record at a time. Pending lines are written out before each
+        rollover check, so rotation still happens between the right records.
+        
+        Args:
+            records (List[logging.LogRecord]): Records to write, in order
+        """
+        lines = []
+        last_record = None
+        self.acquire()
+        try:
+            for record in records:
+                if record.levelno < self.level or not self.filter(record):
+                    continue
+                try:
+                    if self.maxBytes > 0 and self._bytes_written >= self.maxBytes:
+                        self._write_lines(lines, last_record)
+                        lines = []
+                        if self.shouldRollover(record):
+                            self.doRollover()
+                    lines.append(self.format(record))
+                    last_record = record
+                except Exception:
+                    self.handleError(record)
+            self._write_lines(lines, last_record)
+        finally:
+            self.release()
+    
+    def _write_lines(self, lines, record):
+        """
+        Write formatted lines to the log file and flush it
+        
+        Write errors go to handleError, as they do in emit, so a failing disk
+        doesn't propagate into the queue listener or flush timer.
+        
+        Args:
+            lines (List[str]): Formatted records, without terminators
+            record (logging.LogRecord): Last record in lines, reported on error
+        """
+        if not lines:
+            return
+        
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            lines.append("")  # so the join ends with a terminator
+            self.stream.write(self.terminator.join(lines))
+            self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchMemoryHandler(MemoryHandler):
+    """MemoryHandler that passes its whole buffer to a batching target in one call"""
+    
+    def flush(self):
+        """Write the buffered records to the target as one batch"""
+        self.acquire()
+        try:
+            if self.target is not None and self.buffer:
+                try:
+                    self.target.handle_batch(self.buffer)
+                finally:
+                    # Drop the batch even if writing it failed, so it can't pile up
+                    self.buffer.clear()
+        finally:
+            self.release()
+
+
+@functools.lru_cache(maxsize=1)
 def get_log_path():
     """
     Get the path for the log file
     
+    The log directory is created on the first call; later calls return the
+    cached path without touching the filesystem.
+    
     Returns:
         str: Path to the log file
     """
-    # Create the log directory if it doesn't exist
-    log_dir = os.path.join(settings.APP_CONFIG_DIR, "logs")
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir, exist_ok=True)
+    # Create the log directory if it doesn't exist (one mkdir, no separate exists check)
+    log_dir = Path(settings.APP_CONFIG_DIR, "logs")
+    log_dir.mkdir(parents=True, exist_ok=True)
     
     # Return the path to the log file
-    return os.path.join(log_dir, "c0lornote.log")
+    return os.fspath(log_dir / "c0lornote.log")
+
+
+def _schedule_flush(handler):
+    """
+    Flush a buffering handler after FILE_FLUSH_INTERVAL seconds, and keep doing so until it is closed
+    
+    Args:
+        handler (MemoryHandler): The handler to flush
+    """
+    def flush():
+        # A closed MemoryHandler drops its target
+        if handler.target is None:
+            return
+        try:
+            handler.flush()
+        finally:
+            _schedule_flush(handler)
+    
+    timer = threading.Timer(FILE_FLUSH_INTERVAL, flush)
+    timer.daemon = True
+    timer.start()
+
+
+def _close_handler(handler):
+    """
+    Close a handler along with the queue listener or buffer target it feeds
+    
+    Args:
+        handler (logging.Handler): The handler to close
+    """
+    listener = getattr(handler, "listener", None)
+    if listener is not None:
+        atexit.unregister(listener.stop)
+        listener.stop()
+        for downstream in listener.handlers:
+            _close_handler(downstream)
+    
+    # A MemoryHandler flushes to its target on close, then drops it
+    target = getattr(handler, "target", None)
+    handler.close()
+    if target is not None:
+        _close_handler(target)
 
 
 def setup_logger(name="c0lornote", console_level=None, file_level=None):
@@ -61,16 +338,31 @@ def setup_logger(name="c0lornote", console_level=None, file_level=None):
     if file_level is None:
         file_level = DEFAULT_FILE_LEVEL
     
-    # Create logger
+    # Already set up the same way; keep the existing handlers and open file.
+    # The logger remembers the (console_level, file_level) it was set up with.
     logger = logging.getLogger(name)
+    key = (console_level, file_level)
+    if getattr(logger, "_c0lornote_configured", None) == key:
+        return logger
+    
+    # LOG_FORMAT shows no thread, process or task, so don't capture them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False  # Python 3.12+; a no-op attribute before that
+    
+    # Install the caching record class, unless another factory is in place
+    if logging.getLogRecordFactory() is logging.LogRecord:
+        logging.setLogRecordFactory(CachedLogRecord)
+    
     logger.setLevel(logging.DEBUG)  # Set to lowest level to capture all messages
     
-    # Remove existing handlers if any
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    # Close and drop existing handlers if any, with the file chain behind them
+    for handler in logger.handlers:
+        _close_handler(handler)
+    logger.handlers.clear()
     
-    # Create formatters
-    formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+    formatter = _FORMATTER
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -81,33 +373,85 @@ def setup_logger(name="c0lornote", console_level=None, file_level=None):
     try:
         # File handler with rotation
         log_path = get_log_path()
-        file_handler = RotatingFileHandler(
+        file_handler = CachedSizeRotatingFileHandler(
             log_path,
             maxBytes=MAX_LOG_SIZE,
             backupCount=BACKUP_COUNT,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True  # open the file on the first record, not at setup
         )
         file_handler.setLevel(file_level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
         
-        logger.info(f"Log file configured at: {log_path}")
+        buffered_handler = _BatchMemoryHandler(
+            capacity=FILE_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        buffered_handler.setLevel(file_level)
+        _schedule_flush(buffered_handler)
+        
+        # Hand file records to a background thread; callers only pay for an enqueue
+        queue_handler = QueueHandler(queue.SimpleQueue())
+        queue_handler.setLevel(file_level)
+        queue_handler.listener = QueueListener(
+            queue_handler.queue, buffered_handler, respect_handler_level=True
+        )
+        queue_handler.listener.start()
+        atexit.register(queue_handler.listener.stop)
+        logger.addHandler(queue_handler)
+        
+        logger.info("Log file configured at: %s", log_path)
     
     except Exception as e:
-        logger.error(f"Failed to setup file logging: {e}")
+        logger.error("Failed to setup file logging: %s", e, exc_info=True)
     
+    # Give existing child loggers the same explicit level, so their level
+    # checks resolve without walking up to this logger
+    prefix = f"{name}."
+    for child_name, child in list(logger.manager.loggerDict.items()):
+        if child_name.startswith(prefix) and isinstance(child, logging.Logger):
+            child.setLevel(logger.level)
+    
+    logger._c0lornote_configured = key
     return logger
 
 
+@functools.lru_cache(maxsize=None)
 def get_module_logger(module_name):
     """
     Get a logger for a specific module
     
+    Loggers are process-wide singletons, so each one is looked up only once.
+    
     Args:
         module_name (str): Module name (usually __name__)
         
     Returns:
         logging.Logger: Logger for the module
     """
-    return logging.getLogger(f"c0lornote.{module_name}")
+    module_logger = logging.getLogger(f"c0lornote.{module_name}")
+    
+    # Copy the app logger's level (NOTSET until setup_logger runs, which keeps
+    # the normal parent lookup) so level checks stop at the module logger
+    module_logger.setLevel(logging.getLogger("c0lornote").level)
+    return module_logger
+
 
+def debug_enabled(logger):
+    """
+    Check whether a logger emits DEBUG records
+    
+    Use it to skip building costly debug arguments:
+    
+        if debug_enabled(log):
+            log.debug("Search index: %s", summarize(index))
+    
+    Args:
+        logger (logging.Logger): The logger to check
+        
+    Returns:
+        bool: True if DEBUG records would be handled
+    """
+    return logger.isEnabledFor(logging.DEBUG)